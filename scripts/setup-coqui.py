@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Download Coqui TTS models for the voipglot-core runtime package.
+
+Installs the TTS package if needed, lets it fetch the requested models into
+the per-user cache, then clones the cached files into the models/ directory
+that build.ps1 copies next to the executable.
+
+The cache-to-models step clones with hardlinks (or copy-on-write reflinks)
+instead of copying, so duplicating a multi-GB voice model costs metadata
+updates rather than a second pass over every byte.
+"""
+
+import argparse
+import concurrent.futures
+import errno
+import importlib
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+
+MODELS = [
+    "tts_models/en/ljspeech/fast_pitch",
+]
+
+# Buffer for the byte-copy fallback; shutil's 64 KiB default leaves
+# throughput on the table for GB-scale voice models on NVMe.
+COPY_BUFFER = 1 << 22
+
+# TTS symbols resolved on first use: the package may only appear after
+# install_dependencies() has run, and importing it pulls in torch.
+_TTS_EXPORTS = {
+    "ModelManager": ("TTS.utils.manage", "ModelManager"),
+}
+
+
+def _lazy(name):
+    """Import a TTS symbol on first use and cache it at module level."""
+    module_name, attr = _TTS_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    # PEP 562: importers of this module see the TTS symbols as plain
+    # attributes without paying the import cost up front.
+    if name in _TTS_EXPORTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _pip_env():
+    """Environment for pip with a wheel cache shared across setup scripts."""
+    env = os.environ.copy()
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    env.setdefault("PIP_CACHE_DIR", os.path.join(base, "voipglot", "pip"))
+    return env
+
+
+def install_dependencies():
+    """Install the TTS package and its audio I/O dependency if missing."""
+    # find_spec avoids both importing TTS (slow) and re-running pip just to
+    # be told everything is already satisfied.
+    if all(
+        importlib.util.find_spec(pkg) is not None for pkg in ("TTS", "soundfile")
+    ):
+        print("TTS already installed, skipping install")
+        return
+    print("Installing TTS ...")
+    # One invocation lets pip resolve both in a single pass instead of
+    # paying resolver and environment-inspection startup twice.
+    # --prefer-binary skips minutes-long source builds when wheels exist;
+    # --no-input keeps an unattended setup from hanging on a pip prompt.
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--prefer-binary",
+            "--no-input",
+            "TTS",
+            "soundfile",
+        ],
+        check=True,
+        env=_pip_env(),
+    )
+
+
+def _kernel_copy(infd, outfd, bufsize):
+    """Copy infd to outfd without lifting the bytes into userspace.
+
+    Prefers copy_file_range (which can go server-side or reflink on
+    capable filesystems), then sendfile. Raises OSError when the platform
+    offers neither or the descriptors do not support them.
+    """
+    if hasattr(os, "copy_file_range"):
+        while os.copy_file_range(infd, outfd, bufsize):
+            pass
+        return
+    if hasattr(os, "sendfile"):
+        size = os.fstat(infd).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(outfd, infd, offset, size - offset)
+            if not sent:
+                raise OSError(errno.EIO, "sendfile made no progress")
+            offset += sent
+        return
+    raise OSError(errno.ENOSYS, "no kernel copy primitive available")
+
+
+def _copy_file(src, dst, bufsize=COPY_BUFFER):
+    """Byte-copy src to dst with a large buffer, preserving metadata."""
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        try:
+            _kernel_copy(fin.fileno(), fout.fileno(), bufsize)
+        except OSError:
+            # Undo any partial kernel copy before the userspace fallback.
+            fin.seek(0)
+            fout.seek(0)
+            fout.truncate()
+            shutil.copyfileobj(fin, fout, bufsize)
+    shutil.copystat(src, dst)
+
+
+def _clone_tree(src, dst):
+    """Clone src into dst without copying bytes where the filesystem allows.
+
+    Per file, try a hardlink first (os.link maps to CreateHardLinkW on
+    Windows, so both platforms get O(metadata) clones on the same
+    filesystem), then a copy-on-write reflink on Linux, and only fall back
+    to a byte copy when neither applies.
+    """
+    os.makedirs(dst, exist_ok=True)
+    for entry in os.scandir(src):
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            _clone_tree(entry.path, target)
+            continue
+        try:
+            os.link(entry.path, target)
+            continue
+        except OSError:
+            pass  # cross-device, unsupported filesystem, or no privilege
+        if sys.platform.startswith("linux"):
+            result = subprocess.run(
+                ["cp", "--reflink=auto", entry.path, target],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if result.returncode == 0:
+                continue
+        _copy_file(entry.path, target)
+
+
+def download_tts_model(model_name, output_dir):
+    """Fetch model_name into the TTS cache and clone it under output_dir."""
+    print(f"Downloading {model_name} ...")
+    # ModelManager only fetches the files; constructing a TTS() instance
+    # would also load the checkpoint into memory just to locate it on disk.
+    manager = _lazy("ModelManager")(progress_bar=True, verbose=False)
+    cached_model_path, _config_path, _model_item = manager.download_model(
+        model_name
+    )
+    if os.path.isfile(cached_model_path):
+        # Some model types resolve to the checkpoint file itself.
+        cached_model_path = os.path.dirname(cached_model_path)
+
+    model_path = os.path.join(output_dir, os.path.basename(cached_model_path))
+    if os.path.isdir(model_path):
+        shutil.rmtree(model_path)
+    _clone_tree(cached_model_path, model_path)
+    print(f"Model ready: {model_path}")
+    return model_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download Coqui TTS models for voipglot-core"
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        dest="models",
+        metavar="NAME",
+        help="TTS model name; may be given multiple times "
+        f"(default: {', '.join(MODELS)})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="models",
+        help="directory to place the cloned models in (default: models)",
+    )
+    parser.add_argument(
+        "--skip-install",
+        action="store_true",
+        help="assume the TTS package is already installed",
+    )
+    args = parser.parse_args()
+
+    try:
+        if not args.skip_install:
+            install_dependencies()
+        model_names = args.models or MODELS
+        if len(model_names) == 1:
+            download_tts_model(model_names[0], args.output_dir)
+        else:
+            # Downloads are network-bound, so fetching the models
+            # concurrently overlaps their transfer time.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(model_names)
+            ) as executor:
+                list(
+                    executor.map(
+                        lambda name: download_tts_model(name, args.output_dir),
+                        model_names,
+                    )
+                )
+    # The expected failure modes: filesystem/network trouble, pip failing,
+    # or TTS missing despite --skip-install. Bugs keep their traceback.
+    except (OSError, subprocess.CalledProcessError, ImportError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Convert the NLLB-200 translation model to CTranslate2 format.
+
+Downloads the Hugging Face checkpoint, converts it with the CTranslate2
+transformers converter, and places the result in the models/ directory that
+build.ps1 copies next to the executable. The tokenizer files are saved
+alongside the converted weights so voipglot-core can load both from the
+same path.
+"""
+
+import argparse
+import errno
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+REQUIRED_PACKAGES = ("ctranslate2", "transformers", "torch", "sentencepiece")
+
+# huggingface_hub reads this flag once at import time, and the deferred
+# ctranslate2/transformers imports pull the package in — so the switch must
+# be thrown here, before any of them can run.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+DEFAULT_MODEL = "facebook/nllb-200-distilled-600M"
+DEFAULT_OUTPUT = os.path.join("models", "nllb-200-ct2")
+
+
+def check_dependencies():
+    """Verify required packages in one find_spec pass without importing them."""
+    missing = [
+        pkg for pkg in REQUIRED_PACKAGES if importlib.util.find_spec(pkg) is None
+    ]
+    if missing:
+        raise RuntimeError(
+            "missing packages: %s (run with --install first)" % ", ".join(missing)
+        )
+
+
+def _pip_env():
+    """Environment for pip reusing the wheel cache the other setup scripts fill."""
+    env = os.environ.copy()
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    env.setdefault("PIP_CACHE_DIR", os.path.join(base, "voipglot", "pip"))
+    return env
+
+
+def install_dependencies():
+    """Install the converter toolchain."""
+    print("Installing CTranslate2 and transformers ...")
+    # Single invocation: one resolver pass over the joint requirement set.
+    # --prefer-binary matters most for sentencepiece, whose source build
+    # takes minutes; --no-input keeps unattended runs from hanging.
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--prefer-binary",
+            "--no-input",
+            "ctranslate2",
+            "transformers[torch]",
+            "sentencepiece",
+            "hf_transfer",
+        ],
+        check=True,
+        env=_pip_env(),
+    )
+
+
+def _fetch_checkpoint(model_name):
+    """Download the checkpoint up front and return its local snapshot path.
+
+    Uses huggingface_hub directly so the transfer is parallelized; the
+    Rust hf_transfer backend, enabled at module level when installed,
+    saturates fast links far better than the default Python downloader.
+    """
+    from huggingface_hub import snapshot_download
+
+    print(f"Fetching {model_name} ...")
+    return snapshot_download(model_name)
+
+
+def convert_model(model_name, output_dir, quantization="int8"):
+    """Convert model_name to CTranslate2 format under output_dir."""
+    # Deferred: importing torch/transformers costs seconds, which would be
+    # paid even for --help or an argparse error if done at module level.
+    from ctranslate2.converters import TransformersConverter
+    from transformers import AutoTokenizer
+
+    checkpoint = _fetch_checkpoint(model_name)
+
+    parent = os.path.dirname(os.path.abspath(output_dir))
+    os.makedirs(parent, exist_ok=True)
+    # Convert into a sibling temp directory so a failed run never leaves a
+    # half-written model at the final path.
+    tmp_dir = tempfile.mkdtemp(prefix=".ct2-convert-", dir=parent)
+
+    try:
+        print(f"Converting {model_name} ({quantization or 'no'} quantization) ...")
+        converter = TransformersConverter(checkpoint)
+        converter.convert(tmp_dir, quantization=quantization, force=True)
+
+        print("Saving tokenizer ...")
+        tokenizer = AutoTokenizer.from_pretrained(checkpoint)
+        tokenizer.save_pretrained(tmp_dir)
+
+        if os.path.isdir(output_dir):
+            shutil.rmtree(output_dir)
+        try:
+            # Atomic rename: the temp dir lives next to output_dir, so this
+            # is a metadata-only operation instead of shutil.move's
+            # copy-and-delete.
+            os.replace(tmp_dir, output_dir)
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+            shutil.move(tmp_dir, output_dir)
+    finally:
+        # On success the rename already consumed tmp_dir; on failure this
+        # keeps retries from stacking up multi-GB .ct2-convert-* leftovers.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"Model ready: {output_dir}")
+    return output_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert NLLB-200 to CTranslate2 format for voipglot-core"
+    )
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_MODEL,
+        help=f"Hugging Face model to convert (default: {DEFAULT_MODEL})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=DEFAULT_OUTPUT,
+        help=f"directory for the converted model (default: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--quantization",
+        choices=["int8", "int8_float16", "float16", "float32", "none"],
+        default="int8",
+        help="weight quantization for the converted model; int8 quarters "
+        "the model size and speeds up CPU inference (default: int8)",
+    )
+    parser.add_argument(
+        "--install",
+        action="store_true",
+        help="install the converter toolchain before converting",
+    )
+    args = parser.parse_args()
+
+    try:
+        if args.install:
+            install_dependencies()
+        check_dependencies()
+        quantization = None if args.quantization == "none" else args.quantization
+        convert_model(args.model, args.output_dir, quantization)
+    # RuntimeError comes from the dependency check; bugs in the conversion
+    # itself keep their traceback instead of a one-line "Error:".
+    except (OSError, subprocess.CalledProcessError, RuntimeError) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
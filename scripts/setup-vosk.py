@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Download VOSK speech-recognition models for the voipglot-core runtime package.
+
+Fetches a model archive from https://alphacephei.com/vosk/models and unpacks
+it into the models/ directory that build.ps1 copies next to the executable.
+
+Downloads are streamed in large chunks over a single connection and can
+resume a partially downloaded archive, so interrupted multi-hundred-MB
+fetches do not start over from zero.
+"""
+
+import argparse
+import concurrent.futures
+import http.client
+import json
+import os
+import shutil
+import sys
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+import zlib
+
+MODELS = {
+    "en-in": "https://alphacephei.com/vosk/models/vosk-model-en-in-0.5.zip",
+    "en-us": "https://alphacephei.com/vosk/models/vosk-model-en-us-0.22.zip",
+    "en-us-small": "https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip",
+}
+
+DEFAULT_MODEL = "en-in"
+
+# 256 KiB socket reads into a 1 MiB buffered writer keeps syscall counts low
+# without holding more than a couple of chunks in memory.
+CHUNK_SIZE = 1 << 18
+WRITE_BUFFER = 1 << 20
+# copyfileobj chunk size for whole-archive transfers; 4 MiB saturates
+# NVMe/fast links while staying negligible next to the model itself.
+COPY_BUFFER = 1 << 22
+
+
+def _validators(headers):
+    """Build the sidecar metadata dict from HTTP response headers."""
+    return {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+    }
+
+
+def _verify_archive(zip_path):
+    """Check the archive against its stored per-member CRC-32s.
+
+    zipfile verifies through zlib.crc32, which uses the hardware CRC
+    instruction where the zlib build supports it, so a stitched-together
+    resume can be validated without any separate checksum bookkeeping.
+    """
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            return zf.testzip() is None
+    except (zipfile.BadZipFile, zlib.error):
+        # Truncation corrupts the deflate stream itself, which surfaces as
+        # a zlib error before the CRC comparison is ever reached.
+        return False
+
+
+def _download(url, zip_path):
+    """Stream url into zip_path, resuming a partial file if one exists.
+
+    Returns the validator dict (ETag/Last-Modified) describing the
+    downloaded archive.
+    """
+    offset = os.path.getsize(zip_path) if os.path.exists(zip_path) else 0
+    # identity avoids the server gzipping an already-compressed zip
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = "bytes=%d-" % offset
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        resp = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as err:
+        if offset and err.code == 416:
+            # Requested range past EOF: the partial file is already complete.
+            return _validators(err.headers)
+        raise
+    # Append only if the server actually honoured the Range request.
+    mode = "ab" if offset and resp.status == 206 else "wb"
+    with resp, open(zip_path, mode, buffering=WRITE_BUFFER) as out:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        shutil.copyfileobj(resp, out, COPY_BUFFER)
+    return _validators(resp.headers)
+
+
+def _extract(zip_path, output_dir):
+    """Extract zip_path into output_dir with one worker per CPU core.
+
+    zlib releases the GIL while inflating, so decompressing members in a
+    thread pool scales with core count. Each worker opens its own ZipFile
+    because a shared handle is not safe for concurrent reads.
+    """
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = zf.infolist()
+
+    # Create every directory up front so workers never race on mkdir.
+    dirs = {i.filename.rstrip("/") for i in infos if i.is_dir()}
+    dirs.update(os.path.dirname(i.filename) for i in infos if not i.is_dir())
+    for d in sorted(dirs):
+        if d:
+            os.makedirs(os.path.join(output_dir, d), exist_ok=True)
+
+    local = threading.local()
+
+    def extract_member(info):
+        zf = getattr(local, "zipfile", None)
+        if zf is None:
+            zf = local.zipfile = zipfile.ZipFile(zip_path)
+        zf.extract(info, output_dir)
+
+    members = [i for i in infos if not i.is_dir()]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=os.cpu_count()
+    ) as executor:
+        # Drain the iterator so worker exceptions propagate here.
+        list(executor.map(extract_member, members))
+
+
+def _stream_extract(url, output_dir):
+    """Inflate members straight from the HTTP response, skipping the temp zip.
+
+    Requires the stream_unzip package, which decodes a zip from a plain byte
+    iterator. Writing inflated members directly halves the disk write volume
+    compared to spooling the whole archive to disk first.
+    """
+    from stream_unzip import UnzipError, stream_unzip
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    with urllib.request.urlopen(request) as resp:
+
+        def chunks():
+            while chunk := resp.read(CHUNK_SIZE):
+                yield chunk
+
+        try:
+            for name, _size, member_chunks in stream_unzip(chunks()):
+                name = name.decode("utf-8")
+                target = os.path.join(output_dir, name)
+                if name.endswith("/"):
+                    os.makedirs(target, exist_ok=True)
+                    for _ in member_chunks:
+                        pass
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "wb", buffering=WRITE_BUFFER) as out:
+                    for chunk in member_chunks:
+                        out.write(chunk)
+        except UnzipError as err:
+            # Truncated or CRC-bad data; re-raise as the archive error the
+            # top-level handler already treats as an expected failure.
+            raise zipfile.BadZipFile(f"corrupt stream from {url}: {err}") from err
+        return _validators(resp.headers)
+
+
+def _remote_unchanged(url, meta):
+    """Revalidate a local model against the server with a conditional HEAD."""
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    if not headers:
+        return True  # nothing to validate against; trust the local copy
+    request = urllib.request.Request(url, headers=headers, method="HEAD")
+    try:
+        with urllib.request.urlopen(request):
+            return False  # 200: the archive changed upstream
+    except urllib.error.HTTPError as err:
+        if err.code == 304:
+            return True
+        raise
+    except urllib.error.URLError:
+        # Offline or flaky network: keep the local copy rather than fail.
+        return True
+
+
+def download_and_extract(url, output_dir):
+    """Download the model archive at url and unpack it under output_dir.
+
+    A sidecar <model>.meta.json records the server's ETag/Last-Modified
+    validators, so re-runs cost a single conditional HEAD instead of
+    re-downloading an unchanged model. Data integrity comes from the
+    archive's own per-member CRC-32s, which are checked during extraction.
+    """
+    model_name = os.path.basename(url)[: -len(".zip")]
+    model_dir = os.path.join(output_dir, model_name)
+    meta_path = model_dir + ".meta.json"
+    if os.path.isdir(model_dir):
+        # The sidecar is written only after a successful extraction, so a
+        # model directory without one is the leftover of an interrupted
+        # run and cannot be trusted.
+        meta = None
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                meta = None
+        if meta is not None and _remote_unchanged(url, meta):
+            print(f"Model already present: {model_dir}")
+            return model_dir
+        if meta is None:
+            print(f"Found incomplete model, refreshing {model_name} ...")
+        else:
+            print(f"Remote archive changed, refreshing {model_name} ...")
+        # Drop the stale tree (and its sidecar) so files removed upstream
+        # do not survive the overwrite-extract, and so another interrupted
+        # run cannot pair a fresh sidecar with old contents.
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        shutil.rmtree(model_dir)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        print(f"Streaming {url} ...")
+        meta = _stream_extract(url, output_dir)
+    except ImportError:
+        # Without stream_unzip fall back to spooling the archive to disk,
+        # which also keeps the resumable-download path available.
+        zip_path = os.path.join(output_dir, os.path.basename(url))
+        resumed = os.path.exists(zip_path)
+        print(f"Downloading {url} ...")
+        meta = _download(url, zip_path)
+        if resumed and not _verify_archive(zip_path):
+            # A bad resume is the likely cause; refetch once from scratch.
+            print("Resumed archive failed its CRC check, re-downloading ...")
+            os.remove(zip_path)
+            meta = _download(url, zip_path)
+        print(f"Extracting {os.path.basename(zip_path)} ...")
+        _extract(zip_path, output_dir)
+        os.remove(zip_path)
+
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+
+    print(f"Model ready: {model_dir}")
+    return model_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download VOSK models for voipglot-core"
+    )
+    parser.add_argument(
+        "--model",
+        choices=sorted(MODELS),
+        default=DEFAULT_MODEL,
+        help=f"model to download (default: {DEFAULT_MODEL})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="models",
+        help="directory to place the extracted model in (default: models)",
+    )
+    args = parser.parse_args()
+
+    try:
+        download_and_extract(MODELS[args.model], args.output_dir)
+    # OSError covers the urllib errors; HTTPException covers a connection
+    # dropped mid-body (http.client.IncompleteRead). Anything else is a
+    # bug that should surface with a traceback instead of a one-line
+    # "Error:".
+    except (
+        OSError,
+        http.client.HTTPException,
+        zipfile.BadZipFile,
+        json.JSONDecodeError,
+    ) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())